@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import requests
+from requests.adapters import BaseAdapter
+from main import teams, PredictionMethod, SimulationEngine, predict_game, simulate_tournament, run_monte_carlo
+
+# Baselines are machine-specific, so they live outside version control
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".benchmarks", "baseline.json")
+# A benchmark regresses when its throughput drops, or its peak memory grows, by more than this fraction
+REGRESSION_THRESHOLD = 0.2
+
+# Page sizes of the mocked API responses (a full NCAA D-I teams page is ~711 teams)
+TEAMS_PER_PAGE = 711
+PLAYERS_PER_PAGE = 15
+
+class FakeAPIAdapter(BaseAdapter):
+    """requests transport adapter that answers every API call from memory"""
+
+    def __init__(self):
+        super().__init__()
+        self.bodies = {
+            "teams": self._body([
+                {"id": i, "name": f"Team {i}", "logo": f"https://example.com/{i}.png", "national": False, "country": {"name": "USA", "code": "US"}}
+                for i in range(1, TEAMS_PER_PAGE + 1)
+            ]),
+            "players": self._body([
+                {"id": i, "firstname": "First", "lastname": f"Player {i}", "birth": {"date": "2003-01-01", "country": "USA"},
+                 "height": {"meters": "1.98"}, "weight": {"kilograms": "95"}, "leagues": {"2023-2024": {"jersey": i, "active": True}}}
+                for i in range(1, PLAYERS_PER_PAGE + 1)
+            ]),
+        }
+
+    @staticmethod
+    def _body(items):
+        return json.dumps({"errors": [], "results": len(items), "response": items}).encode()
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["x-ratelimit-requests-remaining"] = "7500"
+        response._content = self.bodies[request.path_url.split("?")[0].strip("/")]
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+def _make_scraper():
+    """Scraper backed by mongomock and the fake API, or None when mongomock is not installed"""
+    from data_scraper import BasketballScraper, logger, memory_database
+    try:
+        db = memory_database("benchmark")
+    except ImportError:
+        return None
+
+    # Per-page progress logging would dominate the timings too
+    logger.setLevel("WARNING")
+    scraper = BasketballScraper(base_url="http://api.invalid", db=db, metrics_path=None)
+    scraper.session.mount("http://", FakeAPIAdapter())
+    # The fixed request delay would dominate every timing
+    scraper._sleep = lambda seconds, reason: None
+    return scraper
+
+def _benchmarks(quick=False):
+    """(name, operations per call, callable) for every benchmark"""
+    rng = random.Random(42)
+    teamA, teamB = teams[0], teams[5]
+    benchmarks = []
+
+    for method in PredictionMethod:
+        benchmarks.append((f"predict_game[{method.value}]", 10_000, lambda method=method: [predict_game(teamA, teamB, method) for _ in range(10_000)]))
+
+    benchmarks.append(("simulate_tournament", 10_000, lambda: [simulate_tournament(rng=rng) for _ in range(10_000)]))
+    benchmarks.append(("run_monte_carlo[loop, 10k]", 10_000, lambda: run_monte_carlo(10_000, seed=42)))
+    for n in [10_000, 100_000] + ([] if quick else [1_000_000]):
+        benchmarks.append((f"run_monte_carlo[vectorized, {n // 1000}k]", n, lambda n=n: run_monte_carlo(n, engine=SimulationEngine.VECTORIZED, seed=42)))
+
+    scraper = _make_scraper()
+    if scraper is None:
+        print("mongomock is not installed; skipping the scraper benchmarks")
+    else:
+        benchmarks.append(("fetch_teams_by_league", TEAMS_PER_PAGE, lambda: scraper.fetch_teams_by_league(116, "2023-2024")))
+        team_ids = iter(range(10**9))
+        benchmarks.append(("fetch_players_by_team", PLAYERS_PER_PAGE, lambda: scraper.fetch_players_by_team(next(team_ids), "2023-2024")))
+
+    return benchmarks
+
+def run_benchmarks(repeat=3, quick=False, only=None):
+    """Time every benchmark (best of `repeat`) and measure its peak traced memory in one extra run"""
+    results = {}
+    for name, operations, benchmark in _benchmarks(quick):
+        if only and only not in name:
+            continue
+
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            benchmark()
+            timings.append(time.perf_counter() - started)
+
+        # Tracing slows Python code down, so memory is measured apart from the timings
+        tracemalloc.start()
+        benchmark()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        best = min(timings)
+        results[name] = {"seconds": best, "ops_per_second": operations / best, "peak_memory_mb": peak / 2**20}
+        print(f"{name:40s} {operations / best:14,.0f} ops/s {best * 1000:10.1f} ms {peak / 2**20:9.1f} MB peak")
+    return results
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Names and descriptions of benchmarks that regressed past the threshold against the baseline"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+
+        slowdown = 1 - result["ops_per_second"] / previous["ops_per_second"]
+        if slowdown > threshold:
+            regressions.append(f"{name}: throughput down {slowdown:.0%} ({previous['ops_per_second']:,.0f} -> {result['ops_per_second']:,.0f} ops/s)")
+
+        growth = result["peak_memory_mb"] / max(previous["peak_memory_mb"], 1e-6) - 1
+        # Ignore growth that is small in absolute terms; tiny peaks are noisy
+        if growth > threshold and result["peak_memory_mb"] - previous["peak_memory_mb"] > 1:
+            regressions.append(f"{name}: peak memory up {growth:.0%} ({previous['peak_memory_mb']:.1f} -> {result['peak_memory_mb']:.1f} MB)")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the simulator and scraper hot paths against a saved baseline")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="Allowed fractional slowdown or memory growth")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per benchmark; the best one counts")
+    parser.add_argument("--quick", action="store_true", help="Skip the 1M-simulation benchmark")
+    parser.add_argument("--only", help="Run only benchmarks whose name contains this text")
+    args = parser.parse_args()
+
+    results = run_benchmarks(repeat=args.repeat, quick=args.quick, only=args.only)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results}, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+    else:
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one")
@@ -0,0 +1,136 @@
+import json
+import numpy as np
+
+class Bracket:
+    """Single-elimination bracket compiled to flat arrays.
+
+    Games are stored in round order. Each game has two slots (teamA, teamB);
+    a slot is filled either by a seed or by the winner of an earlier game, so
+    byes are simply seeds that first appear in a later round.
+    """
+
+    def __init__(self, name, rounds, games):
+        self.name = name
+        self.rounds = list(rounds)
+        if len(self.rounds) < 2:
+            raise ValueError(f"Bracket {name!r} needs at least a semifinal and a final round")
+
+        for game in games:
+            if not 0 <= game["round"] < len(self.rounds):
+                raise ValueError(f"Game {game['id']!r} has round {game['round']}, outside the {len(self.rounds)} rounds of {name!r}")
+        games = sorted(games, key=lambda game: game["round"])
+        game_index = {game["id"]: i for i, game in enumerate(games)}
+        if len(game_index) != len(games):
+            raise ValueError(f"Bracket {name!r} has duplicate game ids")
+
+        self.game_ids = [game["id"] for game in games]
+        self.game_round = np.array([game["round"] for game in games], dtype=np.intp)
+        # slot_seed[g, s] is the seed playing in slot s of game g, or -1 when the slot is fed by a game;
+        # slot_game[g, s] is the index of the game whose winner fills the slot, or -1
+        self.slot_seed = np.full((len(games), 2), -1, dtype=np.intp)
+        self.slot_game = np.full((len(games), 2), -1, dtype=np.intp)
+
+        # Each seed enters once and each game's winner moves on to exactly one slot
+        seeded_in = {}
+        fed_into = {}
+        for g, game in enumerate(games):
+            for s, slot in enumerate((game["teamA"], game["teamB"])):
+                if "seed" in slot:
+                    if slot["seed"] in seeded_in:
+                        raise ValueError(f"Seed {slot['seed']} plays in both {seeded_in[slot['seed']]!r} and {game['id']!r}")
+                    seeded_in[slot["seed"]] = game["id"]
+                    self.slot_seed[g, s] = slot["seed"]
+                elif slot.get("winner") in game_index:
+                    feeder = game_index[slot["winner"]]
+                    if self.game_round[feeder] >= self.game_round[g]:
+                        raise ValueError(f"Game {game['id']!r} is fed by {slot['winner']!r}, which is not in an earlier round")
+                    if feeder in fed_into:
+                        raise ValueError(f"The winner of {slot['winner']!r} feeds more than one slot (in {fed_into[feeder]!r} and {game['id']!r})")
+                    fed_into[feeder] = game["id"]
+                    self.slot_game[g, s] = feeder
+                else:
+                    raise ValueError(f"Game {game['id']!r} has a slot with no seed or known winner: {slot}")
+
+        if np.count_nonzero(self.game_round == len(self.rounds) - 1) != 1:
+            raise ValueError(f"Bracket {name!r} must end in a single final game")
+        unplayed = [game["id"] for g, game in enumerate(games[:-1]) if g not in fed_into]
+        if unplayed:
+            raise ValueError(f"The winners of {unplayed} feed no later game in {name!r}")
+
+        # Contiguous game ranges per round, so engines can play a whole round at once
+        self.round_games = [np.flatnonzero(self.game_round == r) for r in range(len(self.rounds))]
+        self.seeds = sorted(int(seed) for seed in self.slot_seed[self.slot_seed >= 0])
+
+    @property
+    def num_games(self):
+        return len(self.game_ids)
+
+    @property
+    def final_game(self):
+        return self.round_games[-1]
+
+    @property
+    def semifinal_games(self):
+        return self.round_games[-2]
+
+    def slot_teams(self, team_seeds):
+        """Team index for each seeded slot (-1 where the slot is fed by a game), given each team's seed"""
+        seed_to_index = {int(seed): i for i, seed in enumerate(team_seeds)}
+        missing = [seed for seed in self.seeds if seed not in seed_to_index]
+        if missing:
+            raise ValueError(f"Bracket {self.name!r} has no team for seeds {missing}")
+
+        slot_teams = np.full(self.slot_seed.shape, -1, dtype=np.intp)
+        seeded = self.slot_seed >= 0
+        slot_teams[seeded] = [seed_to_index[seed] for seed in self.slot_seed[seeded]]
+        return slot_teams
+
+    @classmethod
+    def from_dict(cls, definition):
+        return cls(definition["name"], definition["rounds"], definition["games"])
+
+    @classmethod
+    def load(cls, path):
+        """Load a bracket definition from a JSON file"""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def standard(cls, num_teams, name=None):
+        """Seeded bracket for any field size, e.g. 68 teams with First Four games.
+
+        Fields larger than a power of two get play-in games among the lowest
+        seeds (8 vs 9, 7 vs 10, 6 vs 11 for 11 teams); everyone else gets a bye.
+        """
+        size = 1 << (num_teams.bit_length() - 1)
+        num_play_in = num_teams - size
+        rounds = []
+        games = []
+
+        # Play-in games: seed s vs seed 2 * size + 1 - s for the lowest seeds
+        slot_for_seed = {seed: {"seed": seed} for seed in range(1, size + 1)}
+        if num_play_in:
+            rounds.append("Play-In")
+            for seed in range(size, size - num_play_in, -1):
+                game_id = f"PI-{seed}"
+                games.append({"id": game_id, "round": 0, "teamA": {"seed": seed}, "teamB": {"seed": 2 * size + 1 - seed}})
+                slot_for_seed[seed] = {"winner": game_id}
+
+        # Standard seeding order, e.g. 1, 8, 4, 5, 2, 7, 3, 6 for 8 slots
+        order = [1, 2]
+        while len(order) < size:
+            order = [s for seed in order for s in (seed, 2 * len(order) + 1 - seed)]
+
+        slots = [slot_for_seed[seed] for seed in order]
+        while len(slots) > 1:
+            round_index = len(rounds)
+            num_left = len(slots)
+            rounds.append({2: "Final", 4: "Semifinals", 8: "Quarterfinals"}.get(num_left, f"Round of {num_left}"))
+            next_slots = []
+            for i in range(0, num_left, 2):
+                game_id = f"R{round_index}-{i // 2 + 1}"
+                games.append({"id": game_id, "round": round_index, "teamA": slots[i], "teamB": slots[i + 1]})
+                next_slots.append({"winner": game_id})
+            slots = next_slots
+
+        return cls(name or f"{num_teams}-team bracket", rounds, games)
@@ -0,0 +1,150 @@
+import argparse
+import csv
+import sys
+
+# Each subcommand imports its module only when it runs, so quick simulations never load
+# pandas, pymongo or requests, and `scrape`/`export` never load the simulator
+COMMANDS = {
+    "simulate": "Simulate the tournament and print each team's round probabilities",
+    "scrape": "Scrape NCAA basketball data into MongoDB",
+    "stats": "Print collection statistics and a page of leagues, teams and players",
+    "export": "Export the scraped collections to exports/",
+    "import-ratings": "Attach a season's simulator ratings from a JSON file to the stored teams",
+}
+
+def _simulate_arguments(parser):
+    parser.add_argument("-n", "--simulations", type=int, default=10000, help="Tournaments to simulate (the maximum with --target-se)")
+    parser.add_argument("--method", choices=["barttorvik", "kenpom", "conference_record"], default="barttorvik", help="Game prediction model")
+    parser.add_argument("--engine", choices=["loop", "vectorized"], default="loop", help="Pure-Python loop, or NumPy for large runs")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible results")
+    parser.add_argument("--target-se", type=float, help="Stop once every Championship %% standard error is below this many points")
+    parser.add_argument("--exact", action="store_true", help="Compute exact probabilities instead of sampling")
+    parser.add_argument("--bracket", help="Bracket JSON file (default: brackets/big_east.json)")
+    parser.add_argument("--format", choices=["plain", "csv", "table"], default="plain", help="Aligned text, CSV, or a pandas table")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--ratings-export", metavar="PATH", help="Simulate the rated teams in a view_data teams export (after import-ratings) instead of the Big East field")
+    source.add_argument("--ratings-mongo", action="store_true", help="Simulate the rated teams in the MongoDB teams collection")
+    parser.add_argument("--league", type=int, default=116, help="League id of the rated teams")
+    parser.add_argument("--season", default="2023-2024", help="Season of the rated teams")
+
+def _report_convergence(args, num_run, max_standard_error):
+    print(f"{num_run} simulations run, max Championship % standard error {max_standard_error:.3f} points", file=sys.stderr)
+    if max_standard_error > args.target_se:
+        print(f"Warning: target standard error of {args.target_se} points not reached; raise -n above {args.simulations}", file=sys.stderr)
+
+def _simulate(args):
+    import main
+    from bracket import Bracket
+
+    method = main.PredictionMethod(args.method)
+    bracket = Bracket.load(args.bracket) if args.bracket else None
+
+    team_list = None
+    if args.ratings_export or args.ratings_mongo:
+        import ratings
+        try:
+            if args.ratings_export:
+                team_list = ratings.load_teams_from_export(args.ratings_export, args.league, args.season, method=method)
+            else:
+                from view_data import connect_to_mongodb
+                team_list = ratings.load_teams_from_mongo(connect_to_mongodb(), args.league, args.season, method=method)
+        except (OSError, ValueError) as e:
+            sys.exit(f"cli.py simulate: error: {e}")
+        # The Big East bracket only fits the Big East field
+        if bracket is None:
+            bracket = Bracket.standard(len(team_list))
+
+    if args.format == "table":
+        if args.exact:
+            results_df = main.run_exact(method, bracket=bracket, team_list=team_list)
+        else:
+            results_df = main.run_monte_carlo(args.simulations, method, main.SimulationEngine(args.engine), seed=args.seed,
+                                              target_standard_error=args.target_se, bracket=bracket, team_list=team_list)
+            if args.target_se is not None:
+                _report_convergence(args, results_df.attrs["num_simulations"], results_df.attrs["max_standard_error"])
+        print(results_df.to_string(index=False, float_format=lambda x: f"{x:.1f}%"))
+        return
+
+    if args.exact:
+        rows = main.exact_rows(method, bracket=bracket, team_list=team_list)
+    else:
+        rows, num_run, max_standard_error = main.monte_carlo_rows(args.simulations, method, main.SimulationEngine(args.engine), seed=args.seed,
+                                                                  target_standard_error=args.target_se, bracket=bracket, team_list=team_list)
+        if args.target_se is not None:
+            _report_convergence(args, num_run, max_standard_error)
+
+    header = ("Team", "Championship %", "Finals %", "Semifinals %")
+    if args.format == "csv":
+        writer = csv.writer(sys.stdout)
+        writer.writerow(header)
+        writer.writerows((team, *(f"{value:.4f}" for value in values)) for team, *values in rows)
+    else:
+        width = max(len(header[0]), *(len(row[0]) for row in rows))
+        print(f"{header[0]:<{width}}  " + "  ".join(f"{column:>14}" for column in header[1:]))
+        for team, *values in rows:
+            print(f"{team:<{width}}  " + "  ".join(f"{value:>13.1f}%" for value in values))
+
+def _scrape_arguments(parser):
+    from data_scraper import add_scrape_arguments
+    add_scrape_arguments(parser)
+
+def _scrape(args):
+    from data_scraper import run_scrape
+    run_scrape(args)
+
+def _stats_arguments(parser):
+    from view_data import add_stats_arguments
+    add_stats_arguments(parser)
+
+def _stats(args):
+    from view_data import connect_to_mongodb, show_stats
+    show_stats(connect_to_mongodb(), args)
+
+def _export_arguments(parser):
+    from view_data import add_export_arguments
+    add_export_arguments(parser)
+
+def _export(args):
+    from view_data import connect_to_mongodb, run_export
+    run_export(connect_to_mongodb(), args)
+
+def _import_ratings_arguments(parser):
+    parser.add_argument("path", help="JSON array or NDJSON of ratings records, each with a team_id or name")
+    parser.add_argument("--season", required=True, help="Season the ratings are for, e.g. 2023-2024")
+
+def _import_ratings(args):
+    import ratings
+    from view_data import connect_to_mongodb
+    try:
+        updated, unmatched = ratings.import_ratings(connect_to_mongodb(), args.path, args.season)
+    except (OSError, ValueError) as e:
+        sys.exit(f"cli.py import-ratings: error: {e}")
+    print(f"Attached {args.season} ratings to {updated} teams")
+    if unmatched:
+        print(f"No stored team for: {', '.join(map(str, unmatched))}", file=sys.stderr)
+
+HANDLERS = {
+    "simulate": (_simulate_arguments, _simulate),
+    "scrape": (_scrape_arguments, _scrape),
+    "stats": (_stats_arguments, _stats),
+    "export": (_export_arguments, _export),
+    "import-ratings": (_import_ratings_arguments, _import_ratings),
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description="Big East tournament simulator and NCAA basketball data tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Only the chosen subcommand's options are registered, since that needs its module
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    for name, description in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=description, description=description)
+        if name == command:
+            HANDLERS[name][0](subparser)
+
+    args = parser.parse_args(argv)
+    HANDLERS[args.command][1](args)
+
+if __name__ == "__main__":
+    main()
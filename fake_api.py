@@ -0,0 +1,310 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+EXPORT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "exports")
+# Copies of a team made by --scale get ids offset by multiples of this
+SCALE_ID_OFFSET = 1_000_000
+# Players generated per team and season when the fixtures have no roster for it
+ROSTER_SIZE = 13
+# MongoDB database used by --store mongo load tests; dropped at the start of each run
+LOAD_TEST_DB = "basketball_loadtest"
+
+def _fixture_path(export_dir, collection):
+    """The view_data export of a collection in any of its formats, or None"""
+    for suffix in (".json", ".ndjson", ".json.gz", ".ndjson.gz"):
+        path = os.path.join(export_dir, f"{collection}{suffix}")
+        if os.path.exists(path):
+            return path
+    return None
+
+def _load_fixtures(export_dir, collection):
+    from view_data import read_export
+
+    path = _fixture_path(export_dir, collection)
+    return list(read_export(path)) if path else []
+
+class FakeAPI:
+    """API-Basketball responses replayed from view_data exports.
+
+    Stored documents are turned back into the API's response shapes. Teams
+    are repeated `scale` times per league/season under new ids, and rosters
+    missing from the fixtures are generated deterministically, so a scrape
+    can run at many times the recorded volume. Responses can be delayed, and
+    carry per-minute and daily rate-limit headers; requests over the
+    per-minute limit get a 429 like the real API.
+    """
+
+    def __init__(self, leagues, teams, players=(), scale=1, latency=0.0, jitter=0.0, requests_per_minute=None, daily_quota=7500,
+                 error_rate=0.0, roster_size=ROSTER_SIZE, seed=0):
+        self.leagues = list(leagues)
+        self.scale = scale
+        self.latency = latency
+        self.jitter = jitter
+        self.requests_per_minute = requests_per_minute
+        self.daily_quota = daily_quota
+        self.error_rate = error_rate
+        self.roster_size = roster_size
+        self._rng = random.Random(seed)
+
+        # Teams by (league_id, season) and players by (team_id, season), as the scraper stored them
+        self.teams = {}
+        for team in teams:
+            for entry in team.get("leagues", []):
+                self.teams.setdefault((entry["league_id"], entry["season"]), []).append(team)
+        self.players = {}
+        for player in players:
+            for entry in player.get("teams", []):
+                self.players.setdefault((entry["team_id"], entry["season"]), []).append((player, entry))
+
+        self._lock = threading.Lock()
+        self._recent = deque()
+        self.requests_made = 0
+        self.responses = Counter()
+
+    @classmethod
+    def from_exports(cls, export_dir=EXPORT_DIR, **options):
+        """Fixtures from the leagues, teams and players exports in export_dir"""
+        return cls(_load_fixtures(export_dir, "leagues"), _load_fixtures(export_dir, "teams"), _load_fixtures(export_dir, "players"), **options)
+
+    def _league(self, league):
+        return {
+            "id": league["league_id"],
+            "name": league.get("name"),
+            "type": league.get("type"),
+            "logo": league.get("logo"),
+            "country": {"name": league.get("country"), "code": league.get("country_code")},
+            "seasons": league.get("seasons", []),
+        }
+
+    def _seasons(self):
+        seasons = {entry["season"] if isinstance(entry, dict) else entry for league in self.leagues for entry in league.get("seasons", [])}
+        seasons.update(season for _, season in self.teams)
+        return sorted(seasons)
+
+    def _teams(self, league_id, season):
+        teams = []
+        for copy in range(self.scale):
+            for team in self.teams.get((league_id, season), []):
+                teams.append({
+                    "id": team["team_id"] + copy * SCALE_ID_OFFSET,
+                    "name": team["name"] if copy == 0 else f"{team['name']} {copy + 1}",
+                    "logo": team.get("logo"),
+                    "national": team.get("national", False),
+                    "country": {"name": team.get("country"), "code": team.get("country_code")},
+                })
+        return teams
+
+    def _players(self, team_id, season):
+        recorded = self.players.get((team_id % SCALE_ID_OFFSET, season))
+        if recorded and team_id < SCALE_ID_OFFSET:
+            return [self._player(player["player_id"], player, season, entry) for player, entry in recorded]
+
+        # The same team and season always get the same generated roster
+        rng = random.Random(f"{team_id}-{season}")
+        return [
+            self._player(team_id * 100 + number, {
+                "first_name": f"Player {number}",
+                "last_name": f"Team {team_id}",
+                "birth": {"date": f"{rng.randint(1998, 2006)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", "country": "USA", "place": None},
+                "height": f"{rng.uniform(1.75, 2.20):.2f}",
+                "weight": str(rng.randint(75, 120)),
+            }, season, {"jersey": number, "active": True})
+            for number in range(1, self.roster_size + 1)
+        ]
+
+    @staticmethod
+    def _player(player_id, player, season, membership):
+        return {
+            "id": player_id,
+            "firstname": player.get("first_name"),
+            "lastname": player.get("last_name"),
+            "birth": player.get("birth") or {},
+            "height": {"meters": player.get("height")},
+            "weight": {"kilograms": player.get("weight")},
+            "photo": player.get("photo"),
+            "leagues": {str(season): {"jersey": membership.get("jersey"), "active": membership.get("active")}},
+        }
+
+    def _int_param(self, params, name):
+        try:
+            return int(params.get(name))
+        except (TypeError, ValueError):
+            return None
+
+    def _payload(self, endpoint, params):
+        if endpoint == "leagues":
+            name = params.get("name")
+            return [self._league(league) for league in self.leagues if not name or str(league.get("name", "")).lower() == name.lower()]
+        if endpoint == "seasons":
+            return self._seasons()
+        if endpoint == "teams":
+            return self._teams(self._int_param(params, "league"), params.get("season"))
+        if endpoint == "players":
+            return self._players(self._int_param(params, "team"), params.get("season"))
+        return None
+
+    def _admit(self):
+        """Count a request against the limits; returns (status, seconds until the window frees, minute left, daily left)"""
+        with self._lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= 60:
+                self._recent.popleft()
+
+            if self.requests_per_minute and len(self._recent) >= self.requests_per_minute:
+                return 429, max(1, int(60 - (now - self._recent[0]) + 1)), 0, max(0, self.daily_quota - self.requests_made)
+
+            self._recent.append(now)
+            self.requests_made += 1
+            minute_left = self.requests_per_minute - len(self._recent) if self.requests_per_minute else None
+            # Requests past the daily quota get the quota error rather than an injected 500
+            failed = self.requests_made <= self.daily_quota and self.error_rate and self._rng.random() < self.error_rate
+            status = 500 if failed else 200
+            return status, None, minute_left, self.daily_quota - self.requests_made
+
+    def respond(self, endpoint, params):
+        """(status, headers, body) for one GET request"""
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, self.latency + random.uniform(-self.jitter, self.jitter)))
+
+        status, retry_after, minute_left, daily_left = self._admit()
+        headers = {"x-ratelimit-requests-limit": str(self.daily_quota), "x-ratelimit-requests-remaining": str(max(0, daily_left))}
+        if self.requests_per_minute:
+            headers["x-ratelimit-limit"] = str(self.requests_per_minute)
+            headers["x-ratelimit-remaining"] = str(minute_left)
+        parameters = {name: value for name, value in params.items()}
+
+        if status == 429:
+            headers["x-ratelimit-requests-reset"] = str(retry_after)
+            errors = {"rateLimit": "Too many requests. Your rate limit is exceeded."}
+        elif status == 500:
+            errors = {"server": "Internal server error"}
+        elif daily_left < 0:
+            # The real API answers 200 with an error once the daily plan is used up
+            headers["x-ratelimit-requests-reset"] = "86400"
+            errors = {"requests": "You have reached the request limit for the day."}
+        else:
+            errors = []
+
+        response = [] if errors else self._payload(endpoint, params)
+        if response is None:
+            status, errors, response = 404, {"endpoint": f"This endpoint does not exist: {endpoint}"}, []
+
+        with self._lock:
+            self.responses[(endpoint, status)] += 1
+        body = json.dumps({"get": endpoint, "parameters": parameters, "errors": errors, "results": len(response), "response": response})
+        return status, headers, body.encode()
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        status, headers, body = self.server.api.respond(url.path.strip("/"), params)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # One log line per request would swamp a load test
+        pass
+
+def serve(api, host="127.0.0.1", port=0):
+    """Serve the fake API on a background thread; returns the server and its base URL"""
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.api = api
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+def load_test_database(store="memory"):
+    """Empty database for a load test: the in-process store, or LOAD_TEST_DB on the docker-compose MongoDB.
+
+    The in-process store (mongomock) has no real indexes, so every write scans
+    its collection; it suits runs up to a few times the recorded volume. Use
+    MongoDB for 10x-100x runs.
+    """
+    from data_scraper import MONGO_URI, memory_database
+
+    if store == "memory":
+        return memory_database(LOAD_TEST_DB)
+    import pymongo
+    client = pymongo.MongoClient(MONGO_URI)
+    client.drop_database(LOAD_TEST_DB)
+    return client[LOAD_TEST_DB]
+
+def run_load_test(api, seasons, concurrent=True, max_in_flight=8, max_teams_per_league=None, metrics_path=None, db=None):
+    """Scrape the fake API into `db` (default: a new in-process store) and return a summary of the run"""
+    from data_scraper import AsyncBasketballScraper, BasketballScraper
+
+    server, base_url = serve(api)
+    try:
+        options = dict(base_url=base_url, db=db if db is not None else load_test_database(), metrics_path=metrics_path)
+        if concurrent:
+            # Start at the fake's per-minute rate; the token bucket follows its headers from there
+            scraper = AsyncBasketballScraper(max_in_flight=max_in_flight, requests_per_minute=api.requests_per_minute or 6000, **options)
+        else:
+            scraper = BasketballScraper(**options)
+
+        started = time.monotonic()
+        scraper.scrape_all_ncaa_data(seasons=seasons, max_teams_per_league=max_teams_per_league)
+        elapsed = time.monotonic() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return {
+        "seconds": round(elapsed, 2),
+        "requests": api.requests_made,
+        "requests_per_second": round(api.requests_made / elapsed, 1) if elapsed else None,
+        "responses": {f"{endpoint} {status}": count for (endpoint, status), count in sorted(api.responses.items())},
+        "documents": {name: scraper.db[name].count_documents({}) for name in ("leagues", "seasons", "teams", "players", "team_season_rosters")},
+        "failed_requests": len(scraper.retry_queue),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local API-Basketball stand-in that replays view_data exports")
+    parser.add_argument("--exports", default=EXPORT_DIR, help="Directory with the leagues/teams/players exports to replay")
+    parser.add_argument("--scale", type=int, default=1, help="Serve each league/season's teams this many times over")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds around --latency")
+    parser.add_argument("--requests-per-minute", type=int, help="Per-minute limit; requests over it get a 429")
+    parser.add_argument("--daily-quota", type=int, default=7500, help="Daily plan quota reported in the rate-limit headers")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with a 500")
+    parser.add_argument("--port", type=int, default=8080, help="Port to serve on")
+    parser.add_argument("--load-test", action="store_true", help="Instead of serving, scrape the fake and print timings")
+    parser.add_argument("--store", choices=["memory", "mongo"], default="memory", help=f"--load-test store: in-process, or the {LOAD_TEST_DB} MongoDB database")
+    parser.add_argument("--seasons", nargs="+", default=["2023-2024", "2022-2023"], help="Seasons scraped by --load-test")
+    parser.add_argument("--sync", action="store_true", help="Load-test the sequential scraper, with its fixed delays, instead of the concurrent one")
+    parser.add_argument("--max-in-flight", type=int, default=8, help="Concurrent requests for --load-test")
+    parser.add_argument("--max-teams", type=int, help="Teams per league whose rosters --load-test fetches")
+    parser.add_argument("--metrics", help="Scrape metrics file written by --load-test (.json or .prom)")
+    args = parser.parse_args()
+
+    api = FakeAPI.from_exports(args.exports, scale=args.scale, latency=args.latency, jitter=args.jitter, requests_per_minute=args.requests_per_minute,
+                               daily_quota=args.daily_quota, error_rate=args.error_rate)
+
+    if args.load_test:
+        import logging
+        logging.getLogger("basketball_scraper").setLevel(logging.WARNING)
+        summary = run_load_test(api, args.seasons, concurrent=not args.sync, max_in_flight=args.max_in_flight,
+                                max_teams_per_league=args.max_teams, metrics_path=args.metrics, db=load_test_database(args.store))
+        print(json.dumps(summary, indent=2))
+    else:
+        server, base_url = serve(api, port=args.port)
+        print(f"Serving {sum(len(teams) for teams in api.teams.values()) * args.scale} team-seasons at {base_url}")
+        print(f"Point the scraper at it with: export BASKETBALL_API_BASE_URL={base_url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
@@ -1,8 +1,14 @@
+import argparse
+import contextlib
+import cProfile
+import itertools
+import os
 import random
+import time
 import numpy as np
-import pandas as pd
-from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
+from bracket import Bracket
 
 class PredictionMethod(Enum):
     KENPOM = "kenpom"
@@ -24,54 +30,41 @@ teams = [
     {"name": "Seton Hall", "adjOE": 98.6, "adjDE": 102.7, "seed": 11, "conf_wins": 2, "conf_losses": 18, "overall_wins": 7, "overall_losses": 24, "adjT": 64.6, "home_court": False, "travel_advantage": False}
 ]
 
-# 2. Create the tournament bracket structure
-def create_bracket():
-    return {
-        "first_round": [
-            {"teamA": teams[7], "teamB": teams[8]},   # 8 vs 9
-            {"teamA": teams[6], "teamB": teams[9]},   # 7 vs 10
-            {"teamA": teams[5], "teamB": teams[10]}   # 6 vs 11
-        ],
-        "quarterfinals": [
-            {"teamA": teams[0], "teamB": None},      # 1 vs 8/9 winner
-            {"teamA": teams[3], "teamB": teams[4]},  # 4 vs 5
-            {"teamA": teams[2], "teamB": None},      # 3 vs 6/11 winner
-            {"teamA": teams[1], "teamB": None}       # 2 vs 7/10 winner
-        ],
-        "semifinals": [
-            {"teamA": None, "teamB": None},
-            {"teamA": None, "teamB": None}
-        ],
-        "final": {
-            "teamA": None,
-            "teamB": None,
-            "winner": None
-        }
-    }
+# 2. Load the tournament bracket structure
+BIG_EAST_BRACKET = Bracket.load(os.path.join(os.path.dirname(os.path.abspath(__file__)), "brackets", "big_east.json"))
+
+def _tournament(team_list, bracket):
+    # Default to the Big East field and bracket
+    return TeamTable.as_table(teams if team_list is None else team_list), (BIG_EAST_BRACKET if bracket is None else bracket)
 
 # 3. Predict game outcomes based on team ratings
-def predict_game(teamA, teamB, method=PredictionMethod.BARTTORVIK):
-    if not teamA or not teamB:
-        return None
+# Tunable model constants; run_sensitivity varies these per scenario
+DEFAULT_MODEL_PARAMS = {
+    "kenpom_multiplier": 0.175,
+    "barttorvik_multiplier": 0.135,
+    "home_court_bonus": 0.04,
+    "travel_bonus": 0.02,
+    "regression_threshold": 0.7,
+    "regression_factor": 0.8
+}
+
+def _win_probability_arrays(teamA, teamB, method, params=None):
+    """win_probability on rating columns: teamA/teamB map field names to scalars or broadcastable arrays.
     
-    # Default win probability without venue effects
-    teamA_expected_win_pct = 0.5
+    params overrides DEFAULT_MODEL_PARAMS; its values may also be arrays that
+    broadcast against the ratings, e.g. one value per scenario.
+    """
+    params = DEFAULT_MODEL_PARAMS if params is None else {**DEFAULT_MODEL_PARAMS, **params}
     
     if method == PredictionMethod.KENPOM:
-        # Calculate expected offensive and defensive performance
-        teamA_offense = teamA["adjOE"]
-        teamA_defense = teamA["adjDE"]
-        teamB_offense = teamB["adjOE"]
-        teamB_defense = teamB["adjDE"]
-        
         # Expected points per 100 possessions
-        teamA_expected_score = teamA_offense * (teamB_defense / 100)
-        teamB_expected_score = teamB_offense * (teamA_defense / 100)
+        teamA_expected_score = teamA["adjOE"] * (teamB["adjDE"] / 100)
+        teamB_expected_score = teamB["adjOE"] * (teamA["adjDE"] / 100)
         
         # Calculate win probability using log5 formula with reduced multiplier
-        teamA_expected_win_pct = 1 / (1 + 10 ** (-(teamA_expected_score - teamB_expected_score) * 0.175))
+        return 1 / (1 + 10 ** (-(teamA_expected_score - teamB_expected_score) * params["kenpom_multiplier"]))
     
-    elif method == PredictionMethod.CONFERENCE_RECORD:
+    if method == PredictionMethod.CONFERENCE_RECORD:
         # Calculate win percentages
         teamA_win_pct = teamA["conf_wins"] / (teamA["conf_wins"] + teamA["conf_losses"])
         teamB_win_pct = teamB["conf_wins"] / (teamB["conf_wins"] + teamB["conf_losses"])
@@ -82,135 +75,485 @@ def predict_game(teamA, teamB, method=PredictionMethod.BARTTORVIK):
         teamB_win_pct = (teamB_win_pct * 0.85) + 0.075
         
         # Formula: p(A beats B) = (pA - pA*pB) / (pA + pB - 2*pA*pB)
-        teamA_expected_win_pct = (teamA_win_pct - teamA_win_pct * teamB_win_pct) / (teamA_win_pct + teamB_win_pct - 2 * teamA_win_pct * teamB_win_pct)
-    
-    else:  # PredictionMethod.BARTTORVIK - calibrated to match Barttorvik's results
-        # Calculate expected offensive and defensive performance
-        teamA_offense = teamA["adjOE"]
-        teamA_defense = teamA["adjDE"]
-        teamB_offense = teamB["adjOE"]
-        teamB_defense = teamB["adjDE"]
+        return (teamA_win_pct - teamA_win_pct * teamB_win_pct) / (teamA_win_pct + teamB_win_pct - 2 * teamA_win_pct * teamB_win_pct)
+    
+    # PredictionMethod.BARTTORVIK - calibrated to match Barttorvik's results
+    teamA_expected_win_pct = _barttorvik_expected_win_pct(teamA, teamB, params)
+    
+    teamA_home = np.asarray(teamA["home_court"], dtype=bool)
+    teamB_home = np.asarray(teamB["home_court"], dtype=bool)
+    teamA_travel = np.asarray(teamA["travel_advantage"], dtype=bool)
+    teamB_travel = np.asarray(teamB["travel_advantage"], dtype=bool)
+    
+    # Apply venue effects: home court advantage boost (3-4% boost) or disadvantage
+    home_court_bonus = params["home_court_bonus"]
+    teamA_expected_win_pct = np.where(
+        teamA_home & ~teamB_home, np.minimum(0.95, teamA_expected_win_pct + home_court_bonus),
+        np.where(teamB_home & ~teamA_home, np.maximum(0.05, teamA_expected_win_pct - home_court_bonus), teamA_expected_win_pct)
+    )
+    
+    # Apply travel advantage effects (smaller effect, 1-2% boost)
+    travel_bonus = params["travel_bonus"]
+    teamA_expected_win_pct = np.where(
+        teamA_travel & ~teamB_travel & ~teamB_home, np.minimum(0.95, teamA_expected_win_pct + travel_bonus),
+        np.where(teamB_travel & ~teamA_travel & ~teamA_home, np.maximum(0.05, teamA_expected_win_pct - travel_bonus), teamA_expected_win_pct)
+    )
+    
+    # Add tournament variance - big upsets are slightly more likely in tournaments
+    # Apply mild regression to the mean
+    upper = params["regression_threshold"]
+    lower = 1 - upper
+    factor = params["regression_factor"]
+    return np.where(
+        teamA_expected_win_pct > upper, upper + (teamA_expected_win_pct - upper) * factor,
+        np.where(teamA_expected_win_pct < lower, lower - (lower - teamA_expected_win_pct) * factor, teamA_expected_win_pct)
+    )
+
+def _barttorvik_expected_win_pct(teamA, teamB, params):
+    # Expected points per 100 possessions
+    teamA_expected_score = teamA["adjOE"] * (teamB["adjDE"] / 100)
+    teamB_expected_score = teamB["adjOE"] * (teamA["adjDE"] / 100)
+    
+    # Calculate win probability using calibrated multiplier
+    # Reduced from 0.175 to 0.135 for more balanced probabilities
+    return 1 / (1 + 10 ** (-(teamA_expected_score - teamB_expected_score) * params["barttorvik_multiplier"]))
+
+def _barttorvik_win_probability(teamA, teamB, params=DEFAULT_MODEL_PARAMS):
+    """The BARTTORVIK branch of _win_probability_arrays on plain floats, for one game at a time.
+    
+    np.where on scalars costs far more than the model itself, so single games skip NumPy.
+    """
+    teamA_expected_win_pct = _barttorvik_expected_win_pct(teamA, teamB, params)
+    teamA_home, teamB_home = teamA["home_court"], teamB["home_court"]
+    
+    # Apply venue effects: home court advantage boost (3-4% boost) or disadvantage
+    if teamA_home and not teamB_home:
+        teamA_expected_win_pct = min(0.95, teamA_expected_win_pct + params["home_court_bonus"])
+    elif teamB_home and not teamA_home:
+        teamA_expected_win_pct = max(0.05, teamA_expected_win_pct - params["home_court_bonus"])
+    
+    # Apply travel advantage effects (smaller effect, 1-2% boost)
+    if teamA["travel_advantage"] and not teamB["travel_advantage"] and not teamB_home:
+        teamA_expected_win_pct = min(0.95, teamA_expected_win_pct + params["travel_bonus"])
+    elif teamB["travel_advantage"] and not teamA["travel_advantage"] and not teamA_home:
+        teamA_expected_win_pct = max(0.05, teamA_expected_win_pct - params["travel_bonus"])
+    
+    # Apply mild regression to the mean
+    upper = params["regression_threshold"]
+    lower = 1 - upper
+    if teamA_expected_win_pct > upper:
+        return upper + (teamA_expected_win_pct - upper) * params["regression_factor"]
+    if teamA_expected_win_pct < lower:
+        return lower - (lower - teamA_expected_win_pct) * params["regression_factor"]
+    return teamA_expected_win_pct
+
+def _win_probability_matrices(columns, method, params=None):
+    """P(A beats B) for every pair; columns are (..., N) arrays, giving (..., N, N) matrices"""
+    # Broadcast teamA down the rows and teamB across the columns
+    teamA = {column: values[..., :, None] for column, values in columns.items()}
+    teamB = {column: values[..., None, :] for column, values in columns.items()}
+    win_probs = _win_probability_arrays(teamA, teamB, method, params)
+    
+    num_teams = columns["adjOE"].shape[-1]
+    shape = np.broadcast_shapes(np.shape(win_probs), columns["adjOE"].shape[:-1] + (num_teams, num_teams))
+    win_probs = np.array(np.broadcast_to(win_probs, shape), dtype=np.float64)
+    diagonal = np.arange(num_teams)
+    win_probs[..., diagonal, diagonal] = 0.5
+    return win_probs
+
+def win_probability(teamA, teamB, method=PredictionMethod.BARTTORVIK):
+    """Probability that teamA beats teamB under the given prediction method"""
+    if method == PredictionMethod.BARTTORVIK:
+        return float(_barttorvik_win_probability(teamA, teamB))
+    return float(_win_probability_arrays(teamA, teamB, method))
+
+def predict_game(teamA, teamB, method=PredictionMethod.BARTTORVIK):
+    if not teamA or not teamB:
+        return None
+    
+    teamA_expected_win_pct = win_probability(teamA, teamB, method)
+    
+    # Generate random number to determine winner
+    random_value = random.random()
+    
+    return teamA if random_value < teamA_expected_win_pct else teamB
+
+# 4. Compact team table: one NumPy column per rating, teams addressed by index
+class TeamTable:
+    """Struct-of-arrays team ratings with an index-to-name map.
+    
+    Columns are read-only, so a table can be hashed by content and used as a
+    cache key; build a new table when ratings change.
+    """
+    FLOAT_COLUMNS = ("adjOE", "adjDE", "adjT", "conf_wins", "conf_losses", "overall_wins", "overall_losses")
+    BOOL_COLUMNS = ("home_court", "travel_advantage")
+    
+    def __init__(self, names, seeds, columns):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.seeds = np.array(seeds, dtype=np.int64)
         
-        # Expected points per 100 possessions
-        teamA_expected_score = teamA_offense * (teamB_defense / 100)
-        teamB_expected_score = teamB_offense * (teamA_defense / 100)
+        num_teams = len(self.names)
+        self.columns = {}
+        for column in self.FLOAT_COLUMNS:
+            self.columns[column] = np.array(columns.get(column, np.full(num_teams, np.nan)), dtype=np.float64)
+        for column in self.BOOL_COLUMNS:
+            self.columns[column] = np.array(columns.get(column, np.zeros(num_teams)), dtype=bool)
         
-        # Calculate win probability using calibrated multiplier
-        # Reduced from 0.175 to 0.135 for more balanced probabilities
-        teamA_expected_win_pct = 1 / (1 + 10 ** (-(teamA_expected_score - teamB_expected_score) * 0.135))
+        for array in [self.seeds, *self.columns.values()]:
+            array.flags.writeable = False
+        self._key = (tuple(self.names), self.seeds.tobytes(), *(array.tobytes() for array in self.columns.values()))
+    
+    @classmethod
+    def from_records(cls, team_list):
+        """Build a table from a list of team dicts like the module-level teams"""
+        columns = {}
+        for column in cls.FLOAT_COLUMNS:
+            columns[column] = [team.get(column, np.nan) for team in team_list]
+        for column in cls.BOOL_COLUMNS:
+            columns[column] = [team.get(column, False) for team in team_list]
+        return cls([team["name"] for team in team_list], [team["seed"] for team in team_list], columns)
+    
+    @classmethod
+    def as_table(cls, team_list):
+        return team_list if isinstance(team_list, TeamTable) else cls.from_records(team_list)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def __getitem__(self, column):
+        return self.columns[column]
+    
+    def __eq__(self, other):
+        return isinstance(other, TeamTable) and self._key == other._key
+    
+    def __hash__(self):
+        return hash(self._key)
+    
+    def record(self, team_index):
+        """Team dict for one row, in the same shape as the module-level teams"""
+        team = {"name": self.names[team_index], "seed": int(self.seeds[team_index])}
+        for column in self.FLOAT_COLUMNS:
+            team[column] = float(self.columns[column][team_index])
+        for column in self.BOOL_COLUMNS:
+            team[column] = bool(self.columns[column][team_index])
+        return team
+
+# 5. Precompute P(A beats B) for every pair so simulations only do lookups
+class ProbabilityMatrix:
+    """Pairwise win probabilities for a TeamTable under one PredictionMethod"""
+    
+    def __init__(self, team_table, method=PredictionMethod.BARTTORVIK):
+        self.method = method
+        self.team_names = team_table.names
+        self.index = team_table.index
         
-        # Apply venue effects
-        if teamA["home_court"] and not teamB["home_court"]:
-            # Home court advantage boost (3-4% boost)
-            teamA_expected_win_pct = min(0.95, teamA_expected_win_pct + 0.04)
-        elif teamB["home_court"] and not teamA["home_court"]:
-            # Home court disadvantage
-            teamA_expected_win_pct = max(0.05, teamA_expected_win_pct - 0.04)
+        self.values = _win_probability_matrices(team_table.columns, method)
         
-        # Apply travel advantage effects (smaller effect)
-        if teamA["travel_advantage"] and not teamB["travel_advantage"] and not teamB["home_court"]:
-            # Travel advantage boost (1-2% boost)
-            teamA_expected_win_pct = min(0.95, teamA_expected_win_pct + 0.02)
-        elif teamB["travel_advantage"] and not teamA["travel_advantage"] and not teamA["home_court"]:
-            # Travel advantage disadvantage
-            teamA_expected_win_pct = max(0.05, teamA_expected_win_pct - 0.02)
+        # Plain nested lists are much faster than NumPy scalar indexing in the Python loop
+        self._rows = self.values.tolist()
+    
+    @classmethod
+    def for_teams(cls, team_list=None, method=PredictionMethod.BARTTORVIK):
+        """Return the cached matrix for these teams, rebuilt whenever any rating changes"""
+        if team_list is None:
+            team_list = teams
+        return _cached_probability_matrix(TeamTable.as_table(team_list), method)
+    
+    def win_probability(self, teamA, teamB):
+        return self._rows[self.index[teamA["name"]]][self.index[teamB["name"]]]
+    
+    def play_game(self, teamA, teamB, rng=random):
+        """predict_game equivalent that looks up the precomputed probability"""
+        if not teamA or not teamB:
+            return None
         
-        # Add tournament variance - big upsets are slightly more likely in tournaments
-        # Apply mild regression to the mean
-        if teamA_expected_win_pct > 0.7:
-            teamA_expected_win_pct = 0.7 + (teamA_expected_win_pct - 0.7) * 0.8
-        elif teamA_expected_win_pct < 0.3:
-            teamA_expected_win_pct = 0.3 - (0.3 - teamA_expected_win_pct) * 0.8
+        return teamA if rng.random() < self.win_probability(teamA, teamB) else teamB
+
+@lru_cache(maxsize=32)
+def _cached_probability_matrix(team_table, method):
+    return ProbabilityMatrix(team_table, method)
+
+# Opt-in per-stage timing for simulation runs
+class RunProfile:
+    """Wall time and call counts per stage of a simulation run.
     
-    # Generate random number to determine winner
-    random_value = random.random()
+    Pass profile=True (or a RunProfile to accumulate several runs) to
+    run_monte_carlo or run_all_methods; the profile is stored in
+    results_df.attrs["profile"] and report() formats the breakdown.
+    """
     
-    return teamA if random_value < teamA_expected_win_pct else teamB
+    enabled = True
+    
+    def __init__(self):
+        self.stages = {}
+    
+    @contextlib.contextmanager
+    def stage(self, name, calls=1):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds, count = self.stages.get(name, (0.0, 0))
+            self.stages[name] = (seconds + time.perf_counter() - started, count + calls)
+    
+    def to_dataframe(self):
+        import pandas as pd
+        profile_df = pd.DataFrame(
+            [(name, seconds, calls) for name, (seconds, calls) in self.stages.items()],
+            columns=['Stage', 'Seconds', 'Calls']
+        )
+        profile_df['% of Time'] = profile_df['Seconds'] / max(profile_df['Seconds'].sum(), 1e-12) * 100
+        profile_df['µs per Call'] = profile_df['Seconds'] / profile_df['Calls'].clip(lower=1) * 1e6
+        return profile_df.sort_values('Seconds', ascending=False)
+    
+    def report(self):
+        return self.to_dataframe().to_string(index=False, float_format=lambda x: f"{x:.3f}")
 
-# 4. Run a single tournament simulation
-def simulate_tournament(prediction_method=PredictionMethod.BARTTORVIK):
-    bracket = create_bracket()
-    
-    # First Round
-    first_round_winners = [predict_game(matchup["teamA"], matchup["teamB"], prediction_method) for matchup in bracket["first_round"]]
-    
-    # Update Quarterfinals with First Round winners
-    bracket["quarterfinals"][0]["teamB"] = first_round_winners[0]  # 8/9 winner
-    bracket["quarterfinals"][2]["teamB"] = first_round_winners[2]  # 6/11 winner
-    bracket["quarterfinals"][3]["teamB"] = first_round_winners[1]  # 7/10 winner
-    
-    # Quarterfinals
-    quarterfinals_winners = [predict_game(matchup["teamA"], matchup["teamB"], prediction_method) for matchup in bracket["quarterfinals"]]
-    
-    # Update Semifinals
-    bracket["semifinals"][0]["teamA"] = quarterfinals_winners[0]
-    bracket["semifinals"][0]["teamB"] = quarterfinals_winners[1]
-    bracket["semifinals"][1]["teamA"] = quarterfinals_winners[2]
-    bracket["semifinals"][1]["teamB"] = quarterfinals_winners[3]
-    
-    # Track semifinal teams for additional analysis
-    semifinal_teams = [
-        quarterfinals_winners[0],
-        quarterfinals_winners[1],
-        quarterfinals_winners[2],
-        quarterfinals_winners[3]
-    ]
+class _NoProfile:
+    enabled = False
     
-    # Semifinals
-    semifinals_winners = [predict_game(matchup["teamA"], matchup["teamB"], prediction_method) for matchup in bracket["semifinals"]]
+    def stage(self, name, calls=1):
+        return contextlib.nullcontext()
+
+_NO_PROFILE = _NoProfile()
+
+def _run_profile(profile):
+    """Normalize a profile argument: None/False, True, or an existing RunProfile"""
+    if isinstance(profile, RunProfile):
+        return profile
+    return RunProfile() if profile else _NO_PROFILE
+
+@contextlib.contextmanager
+def _cprofile(profile_path):
+    """Run the block under cProfile and dump the stats to profile_path (for pstats or snakeviz)"""
+    if not profile_path:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
+
+# 6. Run a single tournament simulation
+def _loop_plan(bracket, team_table):
+    # Plain-list copy of the bracket arrays for the per-game Python loop
+    slot_teams = bracket.slot_teams(team_table.seeds)
+    return (
+        list(zip(slot_teams[:, 0].tolist(), bracket.slot_game[:, 0].tolist(), slot_teams[:, 1].tolist(), bracket.slot_game[:, 1].tolist())),
+        int(bracket.final_game[0]),
+        bracket.semifinal_games.tolist()
+    )
+
+def _simulate_tournament_indices(prob_rows, loop_plan, rng):
+    games, final_game, semifinal_games = loop_plan
     
-    # Update Finals
-    bracket["final"]["teamA"] = semifinals_winners[0]
-    bracket["final"]["teamB"] = semifinals_winners[1]
+    # Walk the games in round order; each slot is a seeded team or an earlier game's winner
+    winners = [0] * len(games)
+    for game, (teamA, teamA_feeder, teamB, teamB_feeder) in enumerate(games):
+        if teamA_feeder >= 0:
+            teamA = winners[teamA_feeder]
+        if teamB_feeder >= 0:
+            teamB = winners[teamB_feeder]
+        winners[game] = teamA if rng.random() < prob_rows[teamA][teamB] else teamB
     
-    # Track finals teams
-    final_teams = [semifinals_winners[0], semifinals_winners[1]]
+    def entrants(game):
+        teamA, teamA_feeder, teamB, teamB_feeder = games[game]
+        return [winners[teamA_feeder] if teamA_feeder >= 0 else teamA, winners[teamB_feeder] if teamB_feeder >= 0 else teamB]
     
-    # Championship game
-    bracket["final"]["winner"] = predict_game(bracket["final"]["teamA"], bracket["final"]["teamB"], prediction_method)
+    return winners[final_game], entrants(final_game), [team for game in semifinal_games for team in entrants(game)]
+
+# Tables for team dict lists, keyed by every rating value so editing a team rebuilds its table
+_RECORD_TABLES = {}
+
+def _table_for_records(team_list):
+    key = tuple(itertools.chain.from_iterable(map(dict.values, team_list)))
+    team_table = _RECORD_TABLES.get(key)
+    if team_table is None:
+        if len(_RECORD_TABLES) >= 32:
+            _RECORD_TABLES.clear()
+        team_table = _RECORD_TABLES[key] = TeamTable.from_records(team_list)
+    return team_table
+
+@lru_cache(maxsize=32)
+def _cached_loop_plan(bracket, team_table):
+    return _loop_plan(bracket, team_table)
+
+def simulate_tournament(prediction_method=PredictionMethod.BARTTORVIK, prob_matrix=None, rng=random, bracket=None, team_list=None):
+    team_list = teams if team_list is None else team_list
+    bracket = BIG_EAST_BRACKET if bracket is None else bracket
+    if isinstance(team_list, TeamTable):
+        team_table = team_list
+        to_team = team_table.record
+    else:
+        team_table = _table_for_records(team_list)
+        to_team = team_list.__getitem__
+    loop_plan = _cached_loop_plan(bracket, team_table)
+    if prob_matrix is None:
+        prob_matrix = ProbabilityMatrix.for_teams(team_table, prediction_method)
     
+    champion, finalists, semifinalists = _simulate_tournament_indices(prob_matrix._rows, loop_plan, rng)
     return {
-        "champion": bracket["final"]["winner"],
-        "finalists": final_teams,
-        "semifinalists": semifinal_teams
+        "champion": to_team(champion),
+        "finalists": [to_team(team) for team in finalists],
+        "semifinalists": [to_team(team) for team in semifinalists]
     }
 
-# 5. Run multiple simulations and aggregate results
-def run_monte_carlo(num_simulations=10000, prediction_method=PredictionMethod.BARTTORVIK):
-    championship_results = defaultdict(int)
-    final_appearances = defaultdict(int)
-    semifinal_appearances = defaultdict(int)
+# 7. Simulate many tournaments at once as NumPy arrays
+def _play_round(win_probs, teamA_idx, teamB_idx, draws):
+    # Vectorized predict_game: one uniform draw per simulation per game
+    num_teams = win_probs.shape[-1]
+    pair_index = teamA_idx * num_teams + teamB_idx
+    if win_probs.ndim == 3:
+        # One matrix per scenario on axis 1; every scenario sees the same draws
+        pair_index += (np.arange(len(win_probs)) * num_teams * num_teams)[:, None]
+        draws = draws[:, None, :]
+    teamA_expected_win_pct = win_probs.ravel().take(pair_index)
+    return np.where(draws < teamA_expected_win_pct, teamA_idx, teamB_idx)
+
+def _round_entrants(bracket, slot_teams, games, winners, slot):
+    # Seeded slots are constant; fed slots take the feeding game's row of winners
+    feeders = bracket.slot_game[games, slot]
+    seeded = slot_teams[games, slot].reshape((-1,) + (1,) * (winners.ndim - 1))
+    return np.where(seeded >= 0, seeded, winners[np.maximum(feeders, 0)])
+
+def _simulate_rounds(win_probs, bracket, slot_teams, num_simulations, rng, profile=_NO_PROFILE):
+    """Play every round for a batch of simulations.
     
-    for _ in range(num_simulations):
-        results = simulate_tournament(prediction_method)
-        
-        # Track championship
-        if results["champion"]:
-            championship_results[results["champion"]["name"]] += 1
-        
-        # Track finals appearances
-        for team in results["finalists"]:
-            if team:
-                final_appearances[team["name"]] += 1
-        
-        # Track semifinal appearances
-        for team in results["semifinalists"]:
-            if team:
-                semifinal_appearances[team["name"]] += 1
+    win_probs is one (N, N) matrix or a (S, N, N) stack; stacked matrices all
+    share the same uniform draws (common random numbers). Results put the
+    simulation axis after any scenario axis, e.g. finalists is (S, n, 2).
+    """
+    # Games on the leading axis keep each game's winners contiguous for the next round
+    winners = np.empty((bracket.num_games,) + win_probs.shape[:-2] + (num_simulations,), dtype=np.intp)
+    entrants = {}
+    for round_index, games in enumerate(bracket.round_games):
+        with profile.stage("random draws"):
+            draws = rng.random((len(games), num_simulations))
+        with profile.stage("play games", len(games) * num_simulations):
+            teamA = _round_entrants(bracket, slot_teams, games, winners, 0)
+            teamB = _round_entrants(bracket, slot_teams, games, winners, 1)
+            if round_index >= len(bracket.round_games) - 2:
+                round_entrants = np.stack([teamA, teamB], axis=1).reshape((-1,) + teamA.shape[1:])
+                entrants[round_index] = np.moveaxis(round_entrants, 0, -1)
+            winners[games] = _play_round(win_probs, teamA, teamB, draws)
+    
+    num_rounds = len(bracket.round_games)
+    return {
+        "champion": winners[bracket.final_game[0]],
+        "finalists": entrants[num_rounds - 1],
+        "semifinalists": entrants[num_rounds - 2]
+    }
+
+def simulate_tournaments_vectorized(num_simulations, prediction_method=PredictionMethod.BARTTORVIK, rng=None, prob_matrix=None, bracket=None, team_list=None,
+                                   profile=_NO_PROFILE):
+    """Simulate num_simulations tournaments at once, returning team index arrays per round"""
+    rng = rng if rng is not None else np.random
+    with profile.stage("bracket plan"):
+        team_table, bracket = _tournament(team_list, bracket)
+        if prob_matrix is None:
+            prob_matrix = ProbabilityMatrix.for_teams(team_table, prediction_method)
+        slot_teams = bracket.slot_teams(team_table.seeds)
+    
+    return _simulate_rounds(prob_matrix.values, bracket, slot_teams, num_simulations, rng, profile)
+
+def _stacked_counts(win_probs, bracket, slot_teams, num_simulations, rng, batch_size, profile=_NO_PROFILE):
+    """Championship/finals/semifinal counts per stacked matrix, shape (3, S, N)"""
+    num_stacked, num_teams = win_probs.shape[0], win_probs.shape[-1]
+    counts = np.zeros((3, num_stacked, num_teams), dtype=np.int64)
+    offsets = np.arange(num_stacked)[:, None] * num_teams
+    
+    # batch_size caps the tournaments held in memory across all stacked matrices
+    per_batch = max(1, batch_size // num_stacked)
+    remaining = num_simulations
+    while remaining > 0:
+        batch = min(per_batch, remaining)
+        results = _simulate_rounds(win_probs, bracket, slot_teams, batch, rng, profile)
+        with profile.stage("count results", batch):
+            for stage, key in enumerate(("champion", "finalists", "semifinalists")):
+                flat_index = (results[key].reshape(num_stacked, -1) + offsets).ravel()
+                counts[stage] += np.bincount(flat_index, minlength=num_stacked * num_teams).reshape(num_stacked, num_teams)
+        remaining -= batch
+    
+    return counts
+
+# 8. Run multiple simulations and aggregate results
+class SimulationEngine(Enum):
+    LOOP = "loop"
+    VECTORIZED = "vectorized"
+
+# Tournaments per simulate/count pass when the loop engine is profiled
+PROFILE_CHUNK = 10_000
+
+def _loop_counts(num_simulations, prob_matrix, rng=random, bracket=None, team_list=None, profile=_NO_PROFILE):
+    with profile.stage("bracket plan"):
+        team_table, bracket = _tournament(team_list, bracket)
+        loop_plan = _loop_plan(bracket, team_table)
+    prob_rows = prob_matrix._rows
     
-    # Convert to probabilities
-    team_names = [team["name"] for team in teams]
+    # Count by team index into preallocated counters; plain int lists beat NumPy
+    # scalar updates inside a Python loop
+    championship_counts = [0] * len(team_table)
+    final_counts = [0] * len(team_table)
+    semifinal_counts = [0] * len(team_table)
     
-    championship_probs = {team: (championship_results[team] / num_simulations) * 100 for team in team_names}
-    final_probs = {team: (final_appearances[team] / num_simulations) * 100 for team in team_names}
-    semifinal_probs = {team: (semifinal_appearances[team] / num_simulations) * 100 for team in team_names}
+    def count(champion, finalists, semifinalists):
+        championship_counts[champion] += 1
+        for team in finalists:
+            final_counts[team] += 1
+        for team in semifinalists:
+            semifinal_counts[team] += 1
+    
+    if not profile.enabled:
+        for _ in range(num_simulations):
+            count(*_simulate_tournament_indices(prob_rows, loop_plan, rng))
+    else:
+        # Simulate a chunk, then count it, so the two passes can be timed apart
+        remaining = num_simulations
+        while remaining > 0:
+            chunk = min(PROFILE_CHUNK, remaining)
+            with profile.stage("simulate tournaments (loop)", chunk):
+                results = [_simulate_tournament_indices(prob_rows, loop_plan, rng) for _ in range(chunk)]
+            with profile.stage("count results", chunk):
+                for result in results:
+                    count(*result)
+            remaining -= chunk
+    
+    return np.array(championship_counts), np.array(final_counts), np.array(semifinal_counts)
+
+def _vectorized_counts(num_simulations, prob_matrix, batch_size, rng=None, bracket=None, team_list=None, profile=_NO_PROFILE):
+    num_teams = len(prob_matrix.team_names)
+    championship_counts = np.zeros(num_teams, dtype=np.int64)
+    final_counts = np.zeros(num_teams, dtype=np.int64)
+    semifinal_counts = np.zeros(num_teams, dtype=np.int64)
+    
+    # Simulate in batches so 10M+ runs don't need 10M-row draw matrices at once;
+    # batches of ~64k keep the per-round arrays in cache
+    remaining = num_simulations
+    while remaining > 0:
+        batch = min(batch_size, remaining)
+        results = simulate_tournaments_vectorized(batch, prob_matrix.method, rng, prob_matrix, bracket, team_list, profile)
+        with profile.stage("count results", batch):
+            championship_counts += np.bincount(results["champion"], minlength=num_teams)
+            final_counts += np.bincount(results["finalists"].ravel(), minlength=num_teams)
+            semifinal_counts += np.bincount(results["semifinalists"].ravel(), minlength=num_teams)
+        remaining -= batch
+    
+    return championship_counts, final_counts, semifinal_counts
+
+def _results_dataframe(team_names, championship_counts, final_counts, semifinal_counts, num_simulations):
+    # pandas takes longer to import than a small simulation takes to run, so it is only loaded for tables
+    import pandas as pd
     
     # Format and sort results
     results_df = pd.DataFrame({
         'Team': team_names,
-        'Championship %': [championship_probs[team] for team in team_names],
-        'Finals %': [final_probs[team] for team in team_names],
-        'Semifinals %': [semifinal_probs[team] for team in team_names]
+        'Championship %': championship_counts / num_simulations * 100,
+        'Finals %': final_counts / num_simulations * 100,
+        'Semifinals %': semifinal_counts / num_simulations * 100
     })
     
     # Sort by championship probability
@@ -218,25 +561,328 @@ def run_monte_carlo(num_simulations=10000, prediction_method=PredictionMethod.BA
     
     return results_df
 
+def _results_rows(team_names, championship_counts, final_counts, semifinal_counts, num_simulations):
+    # Same table as _results_dataframe, as plain (team, championship %, finals %, semifinals %) tuples
+    rows = [
+        (team, float(championship) / num_simulations * 100, float(final) / num_simulations * 100, float(semifinal) / num_simulations * 100)
+        for team, championship, final, semifinal in zip(team_names, championship_counts, final_counts, semifinal_counts)
+    ]
+    return sorted(rows, key=lambda row: row[1], reverse=True)
+
+def _championship_standard_errors(championship_counts, num_simulations):
+    # Binomial standard error of each team's Championship %, in percentage points
+    p = championship_counts / num_simulations
+    return np.sqrt(p * (1 - p) / num_simulations) * 100
+
+def _run_until_converged(simulate_counts, max_simulations, target_standard_error, check_every):
+    totals = None
+    num_run = 0
+    
+    while num_run < max_simulations:
+        batch = min(check_every, max_simulations - num_run)
+        counts = simulate_counts(batch)
+        totals = counts if totals is None else tuple(total + count for total, count in zip(totals, counts))
+        num_run += batch
+        
+        if _championship_standard_errors(totals[0], num_run).max() <= target_standard_error:
+            break
+    
+    return totals, num_run
+
+def run_monte_carlo(num_simulations=10000, prediction_method=PredictionMethod.BARTTORVIK, engine=SimulationEngine.LOOP, batch_size=65_536, seed=None,
+                    target_standard_error=None, check_every=10_000, bracket=None, team_list=None, profile=False, profile_path=None):
+    """Simulate the tournament num_simulations times; pass a seed for reproducible results.
+    
+    With target_standard_error (percentage points, e.g. 0.1), simulations run in
+    batches of check_every and stop once every team's Championship % standard
+    error is at or below the target, with num_simulations as the upper bound.
+    The table then gains 95% confidence interval columns; results_df.attrs
+    holds the number of runs used ("num_simulations"), the largest standard
+    error reached ("max_standard_error") and whether it met the target
+    ("converged"), which is False when num_simulations ran out first.
+    
+    bracket and team_list default to the Big East field; pass any Bracket and
+    seeded team list to simulate another tournament.
+    
+    profile=True records per-stage wall time and call counts in
+    results_df.attrs["profile"] (a RunProfile); profile_path also dumps a
+    cProfile of the whole run to that file.
+    """
+    profile = _run_profile(profile)
+    with _cprofile(profile_path):
+        team_names, counts, num_run = _monte_carlo_counts(num_simulations, prediction_method, engine, batch_size, seed, target_standard_error,
+                                                          check_every, bracket, team_list, profile)
+        with profile.stage("results dataframe"):
+            results_df = _results_dataframe(team_names, *counts, num_run)
+            if target_standard_error is not None:
+                import pandas as pd
+                standard_errors = pd.Series(_championship_standard_errors(counts[0], num_run), index=range(len(team_names)))
+                results_df['Championship 95% CI Low'] = (results_df['Championship %'] - 1.96 * standard_errors).clip(lower=0)
+                results_df['Championship 95% CI High'] = (results_df['Championship %'] + 1.96 * standard_errors).clip(upper=100)
+                results_df.attrs["num_simulations"] = num_run
+                results_df.attrs["max_standard_error"] = standard_errors.max()
+                results_df.attrs["converged"] = bool(standard_errors.max() <= target_standard_error)
+    
+    if profile.enabled:
+        results_df.attrs["profile"] = profile
+    return results_df
+
+def monte_carlo_rows(num_simulations=10000, prediction_method=PredictionMethod.BARTTORVIK, engine=SimulationEngine.LOOP, batch_size=65_536, seed=None,
+                     target_standard_error=None, check_every=10_000, bracket=None, team_list=None):
+    """run_monte_carlo's table as (team, championship %, finals %, semifinals %) tuples, without pandas.
+    
+    For quick command-line and scripted runs; also returns the number of
+    simulations actually run, which is below num_simulations when
+    target_standard_error stopped the run early, and with a target the
+    largest Championship % standard error reached (None without one). A value
+    above target_standard_error means num_simulations ran out first.
+    """
+    team_names, counts, num_run = _monte_carlo_counts(num_simulations, prediction_method, engine, batch_size, seed, target_standard_error,
+                                                      check_every, bracket, team_list, _NO_PROFILE)
+    max_standard_error = None
+    if target_standard_error is not None:
+        max_standard_error = float(_championship_standard_errors(counts[0], num_run).max())
+    return _results_rows(team_names, *counts, num_run), num_run, max_standard_error
+
+def _monte_carlo_counts(num_simulations, prediction_method, engine, batch_size, seed, target_standard_error, check_every, bracket, team_list, profile):
+    with profile.stage("probability matrix"):
+        team_table, bracket = _tournament(team_list, bracket)
+        prob_matrix = ProbabilityMatrix.for_teams(team_table, prediction_method)
+    
+    if engine == SimulationEngine.VECTORIZED:
+        rng = np.random.default_rng(seed) if seed is not None else None
+        simulate_counts = lambda n: _vectorized_counts(n, prob_matrix, batch_size, rng, bracket, team_table, profile)
+    else:
+        rng = random.Random(seed) if seed is not None else random
+        simulate_counts = lambda n: _loop_counts(n, prob_matrix, rng, bracket, team_table, profile)
+    
+    if target_standard_error is None:
+        return prob_matrix.team_names, simulate_counts(num_simulations), num_simulations
+    
+    counts, num_run = _run_until_converged(simulate_counts, num_simulations, target_standard_error, check_every)
+    return prob_matrix.team_names, counts, num_run
+
+# 9. Spread simulations across processes, each with its own reproducible RNG stream
+def _parallel_worker(num_simulations, prob_matrix, seed_sequence, batch_size, bracket, team_table):
+    return _vectorized_counts(num_simulations, prob_matrix, batch_size, np.random.default_rng(seed_sequence), bracket, team_table)
+
+def run_monte_carlo_parallel(num_simulations=10000, prediction_method=PredictionMethod.BARTTORVIK, workers=None, seed=42, batch_size=65_536,
+                             bracket=None, team_list=None):
+    """Vectorized Monte Carlo split across a process pool.
+    
+    Worker streams are spawned from one master seed, so the same seed and
+    worker count always give identical results.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    workers = workers or os.cpu_count() or 1
+    team_table, bracket = _tournament(team_list, bracket)
+    prob_matrix = ProbabilityMatrix.for_teams(team_table, prediction_method)
+    
+    # Give each worker an equal share, spreading the remainder over the first few
+    shares = [num_simulations // workers + (1 if i < num_simulations % workers else 0) for i in range(workers)]
+    seed_sequences = np.random.SeedSequence(seed).spawn(workers)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        worker_counts = list(executor.map(
+            _parallel_worker, shares, [prob_matrix] * workers, seed_sequences, [batch_size] * workers, [bracket] * workers, [team_table] * workers
+        ))
+    
+    # Merge the per-worker counters
+    counts = [sum(counts[stage] for counts in worker_counts) for stage in range(3)]
+    return _results_dataframe(prob_matrix.team_names, *counts, num_simulations)
+
+# 10. Exact probabilities by propagating reach probabilities through the bracket
+def _game_winner_distributions(win_probs, teamA_dists, teamB_dists):
+    # Row g holds P(team occupies the slot) for game g; the two slots of a game never share a team
+    return teamA_dists * (teamB_dists @ win_probs.T) + teamB_dists * (teamA_dists @ (1 - win_probs))
+
+def _slot_distributions(bracket, slot_teams, games, winner_dists, slot):
+    feeders = bracket.slot_game[games, slot]
+    seeded = np.eye(winner_dists.shape[1])[np.maximum(slot_teams[games, slot], 0)]
+    return np.where((feeders >= 0)[:, None], winner_dists[np.maximum(feeders, 0)], seeded)
+
+def exact_round_probabilities(prediction_method=PredictionMethod.BARTTORVIK, prob_matrix=None, bracket=None, team_list=None):
+    """Per-team probabilities of reaching each round, computed without sampling"""
+    team_table, bracket = _tournament(team_list, bracket)
+    if prob_matrix is None:
+        prob_matrix = ProbabilityMatrix.for_teams(team_table, prediction_method)
+    win_probs = prob_matrix.values
+    slot_teams = bracket.slot_teams(team_table.seeds)
+    
+    winner_dists = np.zeros((bracket.num_games, len(team_table)))
+    entrant_dists = {}
+    for round_index, games in enumerate(bracket.round_games):
+        teamA_dists = _slot_distributions(bracket, slot_teams, games, winner_dists, 0)
+        teamB_dists = _slot_distributions(bracket, slot_teams, games, winner_dists, 1)
+        entrant_dists[round_index] = (teamA_dists + teamB_dists).sum(axis=0)
+        winner_dists[games] = _game_winner_distributions(win_probs, teamA_dists, teamB_dists)
+    
+    num_rounds = len(bracket.round_games)
+    return {
+        "champion": winner_dists[bracket.final_game[0]],
+        "finalists": entrant_dists[num_rounds - 1],
+        "semifinalists": entrant_dists[num_rounds - 2]
+    }
+
+def run_exact(prediction_method=PredictionMethod.BARTTORVIK, bracket=None, team_list=None):
+    """Same table as run_monte_carlo, but exact: no sampling noise"""
+    team_table, bracket = _tournament(team_list, bracket)
+    probabilities = exact_round_probabilities(prediction_method, bracket=bracket, team_list=team_table)
+    return _results_dataframe(team_table.names, probabilities["champion"], probabilities["finalists"], probabilities["semifinalists"], 1)
+
+def exact_rows(prediction_method=PredictionMethod.BARTTORVIK, bracket=None, team_list=None):
+    """run_exact's table as (team, championship %, finals %, semifinals %) tuples, without pandas"""
+    team_table, bracket = _tournament(team_list, bracket)
+    probabilities = exact_round_probabilities(prediction_method, bracket=bracket, team_list=team_table)
+    return _results_rows(team_table.names, probabilities["champion"], probabilities["finalists"], probabilities["semifinalists"], 1)
+
+# 11. What-if analysis: many parameter variations in one pass
+def scenario_grid(**options):
+    """Every combination of the given values, e.g. scenario_grid(home_court_bonus=[0, 0.04], barttorvik_multiplier=[0.125, 0.135])"""
+    keys = list(options)
+    return [dict(zip(keys, values)) for values in itertools.product(*options.values())]
+
+def run_sensitivity(scenarios, num_simulations=10000, prediction_method=PredictionMethod.BARTTORVIK, seed=None, batch_size=65_536,
+                    bracket=None, team_list=None):
+    """Evaluate many what-if scenarios in one vectorized pass.
+    
+    Each scenario is a dict that may set any DEFAULT_MODEL_PARAMS key, toggle
+    "home_court" or "travel_advantage" by team name ({"St. John's": False}),
+    and nudge ratings with "rating_deltas" ({"St. John's": {"adjOE": -2.0}}).
+    An optional "name" labels the scenario. Every scenario uses the same
+    uniform draws, so differences between scenarios are not sampling noise.
+    
+    Returns a tidy DataFrame with one row per (scenario, team).
+    """
+    import pandas as pd
+    
+    team_table, bracket = _tournament(team_list, bracket)
+    known_keys = set(DEFAULT_MODEL_PARAMS) | set(TeamTable.BOOL_COLUMNS) | {"rating_deltas", "name"}
+    for scenario in scenarios:
+        unknown = set(scenario) - known_keys
+        if unknown:
+            raise ValueError(f"Unknown scenario keys: {sorted(unknown)}")
+    
+    # One row of ratings per scenario, with that scenario's toggles and deltas applied
+    num_scenarios = len(scenarios)
+    columns = {column: np.repeat(values[None, :], num_scenarios, axis=0) for column, values in team_table.columns.items()}
+    for s, scenario in enumerate(scenarios):
+        for team, deltas in scenario.get("rating_deltas", {}).items():
+            for column, delta in deltas.items():
+                columns[column][s, team_table.index[team]] += delta
+        for column in TeamTable.BOOL_COLUMNS:
+            for team, value in scenario.get(column, {}).items():
+                columns[column][s, team_table.index[team]] = value
+    params = {
+        key: np.array([scenario.get(key, default) for scenario in scenarios], dtype=np.float64).reshape(-1, 1, 1)
+        for key, default in DEFAULT_MODEL_PARAMS.items()
+    }
+    
+    win_probs = _win_probability_matrices(columns, prediction_method, params)
+    rng = np.random.default_rng(seed)
+    counts = _stacked_counts(win_probs, bracket, bracket.slot_teams(team_table.seeds), num_simulations, rng, batch_size)
+    
+    # Tidy output: one row per scenario and team, with the scenario's parameters alongside
+    varied = [key for key in DEFAULT_MODEL_PARAMS if any(key in scenario for scenario in scenarios)]
+    results_df = pd.DataFrame({
+        'Scenario': np.repeat([scenario.get("name", s) for s, scenario in enumerate(scenarios)], len(team_table)),
+        'Team': team_table.names * num_scenarios,
+        'Championship %': counts[0].ravel() / num_simulations * 100,
+        'Finals %': counts[1].ravel() / num_simulations * 100,
+        'Semifinals %': counts[2].ravel() / num_simulations * 100,
+        **{key: np.repeat(params[key].ravel(), len(team_table)) for key in varied}
+    })
+    
+    # Keep scenarios in the order given, teams by championship probability within each
+    scenario_order = np.repeat(np.arange(num_scenarios), len(team_table))
+    results_df = results_df.iloc[np.lexsort((-results_df['Championship %'].to_numpy(), scenario_order))]
+    
+    return results_df.reset_index(drop=True)
+
+# 12. Every prediction method in one pass with shared draws
+METHOD_LABELS = {
+    PredictionMethod.BARTTORVIK: "Barttorvik",
+    PredictionMethod.KENPOM: "KenPom",
+    PredictionMethod.CONFERENCE_RECORD: "Conference Record"
+}
+
+def run_all_methods(num_simulations=10000, methods=(PredictionMethod.BARTTORVIK, PredictionMethod.KENPOM, PredictionMethod.CONFERENCE_RECORD),
+                    seed=None, batch_size=65_536, bracket=None, team_list=None, profile=False, profile_path=None):
+    """Simulate several PredictionMethods together, one column block per method.
+    
+    All methods play against the same uniform draws (common random numbers),
+    so the bracket is walked once and differences between methods are far
+    less noisy than in separate runs. profile and profile_path work as in
+    run_monte_carlo.
+    """
+    import pandas as pd
+    
+    profile = _run_profile(profile)
+    with _cprofile(profile_path):
+        with profile.stage("probability matrix"):
+            team_table, bracket = _tournament(team_list, bracket)
+            win_probs = np.stack([ProbabilityMatrix.for_teams(team_table, method).values for method in methods])
+            slot_teams = bracket.slot_teams(team_table.seeds)
+        counts = _stacked_counts(win_probs, bracket, slot_teams, num_simulations, np.random.default_rng(seed), batch_size, profile)
+        
+        with profile.stage("results dataframe"):
+            results_df = pd.DataFrame(
+                {
+                    (METHOD_LABELS[method], column): counts[stage, m] / num_simulations * 100
+                    for m, method in enumerate(methods)
+                    for stage, column in enumerate(('Championship %', 'Finals %', 'Semifinals %'))
+                },
+                index=pd.Index(team_table.names, name='Team')
+            )
+            
+            # Sort by the first method's championship probability
+            results_df = results_df.sort_values((METHOD_LABELS[methods[0]], 'Championship %'), ascending=False)
+    
+    if profile.enabled:
+        results_df.attrs["profile"] = profile
+    return results_df
+
 # Run simulations and display results
 if __name__ == "__main__":
-    np.random.seed(42)  # For reproducibility
-    random.seed(42)
+    parser = argparse.ArgumentParser(description="Simulate the Big East tournament")
+    parser.add_argument("--profile", action="store_true", help="Print a per-stage timing breakdown of the Monte Carlo run")
+    parser.add_argument("--profile-output", help="Also dump a cProfile of the Monte Carlo run to this file")
+    args = parser.parse_args()
+    
+    SEED = 42  # For reproducibility
     
-    # Run 10,000 simulations with Barttorvik calibrated model
-    barttorvik_results = run_monte_carlo(100000, PredictionMethod.BARTTORVIK)
+    # Exact bracket probabilities with the Barttorvik calibrated model
+    barttorvik_results = run_exact(PredictionMethod.BARTTORVIK)
     
-    print("Big East Tournament Simulation Results - Barttorvik Method (100,000 runs):")
+    print("Big East Tournament Simulation Results - Barttorvik Method (exact):")
     print(barttorvik_results.to_string(index=False, float_format=lambda x: f"{x:.1f}%"))
     
-    print("\nBig East Tournament Simulation Results - KenPom Method (100,000 runs):")
-    kenpom_results = run_monte_carlo(100000, PredictionMethod.KENPOM)
+    print("\nBig East Tournament Simulation Results - KenPom Method (exact):")
+    kenpom_results = run_exact(PredictionMethod.KENPOM)
     print(kenpom_results.to_string(index=False, float_format=lambda x: f"{x:.1f}%"))
     
-    print("\nBig East Tournament Simulation Results - Conference Record Method (100,000 runs):")
-    conf_record_results = run_monte_carlo(100000, PredictionMethod.CONFERENCE_RECORD)
+    print("\nBig East Tournament Simulation Results - Conference Record Method (exact):")
+    conf_record_results = run_exact(PredictionMethod.CONFERENCE_RECORD)
     print(conf_record_results.to_string(index=False, float_format=lambda x: f"{x:.1f}%"))
     
+    # Validate the exact numbers against one Monte Carlo pass over all three methods
+    monte_carlo_results = run_all_methods(100000, seed=SEED, profile=args.profile, profile_path=args.profile_output)
+    print()
+    for method, exact_results in [
+        (PredictionMethod.BARTTORVIK, barttorvik_results),
+        (PredictionMethod.KENPOM, kenpom_results),
+        (PredictionMethod.CONFERENCE_RECORD, conf_record_results)
+    ]:
+        deviation = (monte_carlo_results[METHOD_LABELS[method]] - exact_results.set_index('Team')).abs().max().max()
+        print(f"Monte Carlo check ({METHOD_LABELS[method]}, 100,000 runs): max deviation {deviation:.2f} percentage points")
+    
+    if args.profile:
+        print("\nMonte Carlo stage timings:")
+        print(monte_carlo_results.attrs["profile"].report())
+    if args.profile_output:
+        print(f"cProfile stats written to {args.profile_output} (python -m pstats {args.profile_output})")
+    
     # Additional analysis - expected seed of champion
     print("\nAdvanced Analysis:")
-    # Add more sophisticated analysis here as needed
\ No newline at end of file
+    # Add more sophisticated analysis here as needed
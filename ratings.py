@@ -0,0 +1,144 @@
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+import numpy as np
+from main import PredictionMethod, TeamTable
+from view_data import read_export
+
+logger = logging.getLogger("ratings")
+
+# Snapshots live next to the exports and are safe to delete at any time
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".snapshots")
+DEFAULT_EXPORT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "exports", "teams.json")
+
+# Team documents carry simulator ratings per season, e.g.
+# {"team_id": 1803, "name": ..., "ratings": {"2023-2024": {"adjOE": 112.7, "adjDE": 90.4, "seed": 1, ...}}}
+RATING_FIELDS = TeamTable.FLOAT_COLUMNS + TeamTable.BOOL_COLUMNS
+
+# Every rated team needs an efficiency margin (it also seeds unseeded fields);
+# a missing column would turn into NaN and poison the method that reads it
+REQUIRED_FIELDS = ("adjOE", "adjDE")
+METHOD_FIELDS = {PredictionMethod.CONFERENCE_RECORD: ("conf_wins", "conf_losses")}
+
+def _required_fields(method):
+    return REQUIRED_FIELDS + METHOD_FIELDS.get(method, ())
+
+def _in_league_season(team, league_id, season):
+    return any(entry.get("league_id") == league_id and entry.get("season") == season for entry in team.get("leagues", []))
+
+def _team_table_from_documents(documents, league_id, season, required=REQUIRED_FIELDS):
+    """Build a TeamTable from team documents that have the required ratings for the season"""
+    rated = []
+    skipped = 0
+    for team in documents:
+        if not _in_league_season(team, league_id, season):
+            continue
+        season_ratings = team.get("ratings", {}).get(season)
+        if not season_ratings or any(season_ratings.get(field) is None for field in required):
+            skipped += 1
+            continue
+        rated.append({"name": team["name"], **season_ratings})
+
+    if skipped:
+        logger.info(f"Skipped {skipped} teams without {season} ratings for {', '.join(required)} in league {league_id}")
+    if not rated:
+        raise ValueError(f"No teams in league {league_id}, season {season} have {', '.join(required)} ratings; "
+                         f"attach them with `cli.py import-ratings FILE --season {season}`")
+    # A bracket needs at least a semifinal and a final
+    if len(rated) < 3:
+        raise ValueError(f"Only {len(rated)} teams in league {league_id}, season {season} have {', '.join(required)} ratings; "
+                         "a tournament needs at least 3")
+
+    # Teams without a tournament seed are seeded by efficiency margin
+    if any("seed" not in team for team in rated):
+        rated.sort(key=lambda team: team["adjDE"] - team["adjOE"])
+        for seed, team in enumerate(rated, start=1):
+            team["seed"] = seed
+
+    return TeamTable.from_records(rated)
+
+def _snapshot_path(snapshot_dir, *key_parts):
+    key = hashlib.sha1(json.dumps([str(part) for part in key_parts]).encode()).hexdigest()[:16]
+    return os.path.join(snapshot_dir, f"teams-{key}.npz")
+
+def _save_snapshot(path, team_table):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temporary file first so a crash never leaves a truncated snapshot
+    tmp_path = f"{path}.tmp.npz"
+    np.savez(tmp_path, names=np.array(team_table.names), seeds=team_table.seeds, **team_table.columns)
+    os.replace(tmp_path, path)
+
+def _load_snapshot(path):
+    with np.load(path, allow_pickle=False) as snapshot:
+        columns = {column: snapshot[column] for column in RATING_FIELDS}
+        return TeamTable(snapshot["names"].tolist(), snapshot["seeds"], columns)
+
+def load_teams_from_export(path=DEFAULT_EXPORT, league_id=116, season="2023-2024", snapshot_dir=SNAPSHOT_DIR,
+                           method=PredictionMethod.BARTTORVIK):
+    """Load a season's rated teams from a view_data JSON export.
+
+    Only teams with every rating the method needs are loaded. The parsed
+    table is cached as an .npz snapshot keyed by the export's path, size and
+    mtime, so later runs skip parsing the JSON entirely.
+    """
+    required = _required_fields(method)
+    stat = os.stat(path)
+    snapshot_path = _snapshot_path(snapshot_dir, os.path.abspath(path), stat.st_size, stat.st_mtime_ns, league_id, season, required)
+    if os.path.exists(snapshot_path):
+        return _load_snapshot(snapshot_path)
+
+    documents = read_export(path)
+    team_table = _team_table_from_documents(documents, league_id, season, required)
+    _save_snapshot(snapshot_path, team_table)
+    logger.info(f"Saved ratings snapshot for {len(team_table)} teams to {snapshot_path}")
+    return team_table
+
+def load_teams_from_mongo(db, league_id=116, season="2023-2024", snapshot_dir=SNAPSHOT_DIR, method=PredictionMethod.BARTTORVIK):
+    """Load a season's rated teams from the MongoDB teams collection.
+
+    The snapshot is keyed by the newest updated_at and the number of teams in
+    the league/season, so only a cheap sorted lookup runs when nothing changed.
+    """
+    required = _required_fields(method)
+    query = {"leagues": {"$elemMatch": {"league_id": league_id, "season": season}}}
+    newest = db.teams.find_one(query, {"updated_at": 1}, sort=[("updated_at", -1)])
+    if newest is None:
+        raise ValueError(f"No teams found for league {league_id}, season {season}")
+
+    num_teams = db.teams.count_documents(query)
+    snapshot_path = _snapshot_path(snapshot_dir, db.name, newest.get("updated_at"), num_teams, league_id, season, required)
+    if os.path.exists(snapshot_path):
+        return _load_snapshot(snapshot_path)
+
+    projection = {"team_id": 1, "name": 1, "leagues": 1, f"ratings.{season}": 1}
+    team_table = _team_table_from_documents(db.teams.find(query, projection), league_id, season, required)
+    _save_snapshot(snapshot_path, team_table)
+    logger.info(f"Saved ratings snapshot for {len(team_table)} teams to {snapshot_path}")
+    return team_table
+
+def import_ratings(db, path, season):
+    """Attach a season's ratings to the stored teams from a JSON array or NDJSON file.
+
+    Each record names its team by team_id or, failing that, by name, e.g.
+    {"name": "Creighton", "adjOE": 117.2, "adjDE": 98.2, "seed": 2, ...}.
+    Rating fields replace ratings.<season> and bump updated_at, so the Mongo
+    snapshot is rebuilt. Returns the number of teams updated and the records
+    that matched no team.
+    """
+    now = datetime.now()
+    updated = 0
+    unmatched = []
+    for record in read_export(path):
+        season_ratings = {field: record[field] for field in ("seed", *RATING_FIELDS) if record.get(field) is not None}
+        query = {"team_id": record["team_id"]} if record.get("team_id") is not None else {"name": record.get("name")}
+        result = db.teams.update_one(query, {"$set": {f"ratings.{season}": season_ratings, "updated_at": now}})
+        if result.matched_count:
+            updated += 1
+        else:
+            unmatched.append(record.get("team_id") or record.get("name"))
+
+    if unmatched:
+        logger.warning(f"No stored team for {len(unmatched)} ratings records: {unmatched}")
+    return updated, unmatched
@@ -0,0 +1,122 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf"))
+# Quota samples kept for the quota-over-time series
+MAX_QUOTA_SAMPLES = 10_000
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+def _format_bound(bound):
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
+
+class ScrapeMetrics:
+    """Thread-safe counters, gauges and latency histograms for a scrape run.
+
+    Written at the end of a run as JSON, or as Prometheus text when the file
+    name ends in .prom, e.g. for the node_exporter textfile collector.
+    """
+
+    PREFIX = "basketball_scraper_"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.counters = defaultdict(lambda: defaultdict(float))
+        self.gauges = defaultdict(dict)
+        self.histograms = defaultdict(dict)
+        self.quota_samples = []
+
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            self.counters[name][_label_key(labels)] += value
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self.gauges[name][_label_key(labels)] = value
+
+    def observe(self, name, seconds, **labels):
+        """Add a latency observation to a histogram"""
+        with self._lock:
+            key = _label_key(labels)
+            histogram = self.histograms[name].setdefault(key, {"buckets": [0] * len(LATENCY_BUCKETS), "sum": 0.0, "count": 0})
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    histogram["buckets"][i] += 1
+                    break
+            histogram["sum"] += seconds
+            histogram["count"] += 1
+
+    def record_quota(self, remaining):
+        """Track the daily quota left, as a gauge and as a time series"""
+        self.set("api_quota_remaining", remaining)
+        with self._lock:
+            if len(self.quota_samples) < MAX_QUOTA_SAMPLES:
+                self.quota_samples.append((round(time.time() - self.started, 3), remaining))
+
+    def to_dict(self):
+        with self._lock:
+            def series(values):
+                return [{"labels": dict(key), "value": value} for key, value in values.items()]
+
+            histograms = {}
+            for name, values in self.histograms.items():
+                histograms[name] = []
+                for key, histogram in values.items():
+                    cumulative = 0
+                    buckets = {}
+                    for bound, count in zip(LATENCY_BUCKETS, histogram["buckets"]):
+                        cumulative += count
+                        buckets[_format_bound(bound)] = cumulative
+                    histograms[name].append({"labels": dict(key), "buckets": buckets, "sum": histogram["sum"], "count": histogram["count"]})
+
+            return {
+                "elapsed_seconds": round(time.time() - self.started, 3),
+                "counters": {name: series(values) for name, values in self.counters.items()},
+                "gauges": {name: series(values) for name, values in self.gauges.items()},
+                "histograms": histograms,
+                "quota_remaining_over_time": self.quota_samples,
+            }
+
+    def to_prometheus(self):
+        snapshot = self.to_dict()
+        lines = [
+            f"# TYPE {self.PREFIX}elapsed_seconds gauge",
+            f"{self.PREFIX}elapsed_seconds {snapshot['elapsed_seconds']}",
+        ]
+        for kind in ("counters", "gauges"):
+            for name, values in snapshot[kind].items():
+                lines.append(f"# TYPE {self.PREFIX}{name} {'counter' if kind == 'counters' else 'gauge'}")
+                for value in values:
+                    lines.append(f"{self.PREFIX}{name}{_format_labels(value['labels'].items())} {value['value']:g}")
+        for name, values in snapshot["histograms"].items():
+            lines.append(f"# TYPE {self.PREFIX}{name} histogram")
+            for value in values:
+                labels = list(value["labels"].items())
+                for bound, count in value["buckets"].items():
+                    lines.append(f"{self.PREFIX}{name}_bucket{_format_labels(labels, [('le', bound)])} {count}")
+                lines.append(f"{self.PREFIX}{name}_sum{_format_labels(labels)} {value['sum']:g}")
+                lines.append(f"{self.PREFIX}{name}_count{_format_labels(labels)} {value['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write the metrics to `path`: Prometheus text for *.prom, JSON otherwise"""
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        text = self.to_prometheus() if path.endswith(".prom") else json.dumps(self.to_dict(), indent=2)
+        # Replace the file in one step so a scraping collector never reads half of it
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)